@@ -49,6 +49,7 @@ RIGHT = 3
 """Right text justification."""
 
 _HALIGN_ALLOWED = [NOT_SPECIFIED, LEFT, CENTER, RIGHT]
+_ALIGN_BY_INDEX = (LEFT, CENTER, RIGHT)    # order of align_spec_chars
 _HALIGN_HELP = '\n'.join([
     'Expected a horizontal align value, got: "{0}".',
     'Allowed values are: _NOT_SPECIFIED, _LEFT, _CENTER, _RIGHT'])
@@ -102,19 +103,22 @@ def split_up(prefixed_string: str, align_spec_chars: str) -> Tuple[int, str]:
 
     # skip doing split up if either param is an empty string
     if align_spec_chars and prefixed_string:
-        # 1. The asserts and align_map need only be calculated once per
+        # 1. The asserts need only be checked once per
         #    table() or bordered_table() rather than multiple times.
         #    [once per title, each heading, and each format]
         #    The checks are done here as a trade off favoring simpler
         #    logic over minimal reduction in execution time.
-        # 2. Creating align_map below dynamically allows modifying the class
-        #    attribute align_spec_chars on an instance.
+        # 2. Looking up the first char in align_spec_chars each call
+        #    allows modifying the class attribute align_spec_chars
+        #    on an instance.
         assert len(align_spec_chars) == 3, 'left, center, right'
         assert len(set(align_spec_chars)) == 3, 'must be unique'
-        align_map = dict(zip(align_spec_chars, (LEFT, CENTER, RIGHT)))
-        align = align_map.get(prefixed_string[0], NOT_SPECIFIED)
-        if align:
+        index = align_spec_chars.find(prefixed_string[0])
+        if index >= 0:
+            align = _ALIGN_BY_INDEX[index]
             prefixed_string = prefixed_string[1:]  # drop align_spec char
+        else:
+            align = NOT_SPECIFIED
     else:
         align = NOT_SPECIFIED
     return align, prefixed_string
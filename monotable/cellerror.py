@@ -33,6 +33,8 @@ class MonoTableCellError(Exception):
 
             trace_text (str):
                 Exception trace information for root cause of the exception.
+                When created with cause, the trace is formatted from cause
+                on first access.
 
             name (str):
                 Name of the exception shown in the string representation.
@@ -44,13 +46,29 @@ class MonoTableCellError(Exception):
         column: int,
         format_spec: str = "",
         trace_text: Optional[str] = None,
+        cause: Optional[BaseException] = None,
     ):
         self.row = row
         self.column = column
         self.format_spec = format_spec
-        self.trace_text = trace_text
+        self._trace_text = trace_text
+        self._cause = cause
         self.name = 'MonoTableCellError'
 
+    @property
+    def trace_text(self) -> Optional[str]:
+        """Trace text, formatted from the root cause when first needed."""
+        if self._trace_text is None and self._cause is not None:
+            import traceback
+            cause = self._cause
+            self._trace_text = ''.join(traceback.format_exception(
+                type(cause), cause, cause.__traceback__))
+        return self._trace_text
+
+    @trace_text.setter
+    def trace_text(self, value: Optional[str]) -> None:
+        self._trace_text = value
+
     def __str__(self) -> str:
         """Show cell's position, format_spec, and trace info."""
 
@@ -18,8 +18,6 @@
 
 """Dataclass printer. Tools to pretty print dataclasses"""
 
-import dataclasses
-import textwrap
 from typing import Any, Dict, List, Optional, Tuple
 
 import monotable
@@ -145,6 +143,9 @@ def _format(
     # field_name: string prepended to a nested dataclass header.
     # visited: id(s) of dataclasses that have already been printed.
     # depth: > 1 indicates this field is a field of an enclosing dataclass.
+    # Imported here to keep it out of the import monotable startup time.
+    import dataclasses
+
     assert dataclasses.is_dataclass(dataclass_instance), "Must be a dataclass instance."
 
     # Save the Python built in function id() of the caller's
@@ -272,6 +273,9 @@ def do_nested(
     # When no more depth we indent 2 spaces at the lowest level and then return the
     # table string.  As we complete each recursive call an additional 2 spaces of
     # indent is applied.
+    # Imported here to keep it out of the import monotable startup time.
+    import textwrap
+
     indent = "  "
     for nested_dotted_field_name, nested_help, nested in nested_dataclasses:
         nested_title = ""
@@ -39,6 +39,9 @@ class MonoBlock:
 
     Methods:
 
+        clone()
+            Return a copy that can be justified independently.
+
         is_all_spaces()
             Tests if object contains only whitespace.
 
@@ -72,8 +75,17 @@ class MonoBlock:
 
         lines
             List of lines of text.
+
+    MonoBlock defines __slots__ so instances have no __dict__.  Setting
+    an attribute not listed above raises AttributeError.
     """
 
+    # Slots avoid a per instance __dict__.  A table creates a MonoBlock
+    # for each heading and each cell.  Instances can still be weakly
+    # referenced.
+    __slots__ = ('lines', 'height', 'width', '_halign', '_is_hjustified',
+                 '__weakref__')
+
     def __init__(self, text: str = '', halign: int = LEFT) -> None:
         """
         Create MonoBlock from caller's string.
@@ -91,19 +103,47 @@ class MonoBlock:
         """
 
         monotable.alignment.validate_horizontal_align(halign)
-        self.lines = text.splitlines()
-        if not self.lines:
-            self.lines = ['']
+        lines = text.splitlines() or ['']
+        self.lines = lines
         self._halign = halign
         # keep track if has been horizontally justified for add_border()
         self._is_hjustified = False
-        self._update_height_and_width()
+        self.height = len(lines)
+        self.width = max(map(len, lines))
+
+    def clone(self) -> 'MonoBlock':
+        """Return a copy that can be justified independently of self.
+
+        Faster than copy.copy().  The list of lines is copied so that
+        in-place changes to the clone do not affect self.
+        """
+
+        cls = self.__class__
+        block = cls.__new__(cls)
+        if hasattr(self, '__dict__'):    # subclass without __slots__
+            block.__dict__.update(self.__dict__)
+        block.lines = list(self.lines)
+        block.height = self.height
+        block.width = self.width
+        block._halign = self._halign
+        block._is_hjustified = self._is_hjustified
+        return block
+
+    def __copy__(self) -> 'MonoBlock':
+        # copy.copy() uses clone() instead of the generic reduce protocol.
+        # Call through self so a subclass override of clone() is used.
+        return self.clone()
 
     def is_all_spaces(self) -> bool:
         """Return True if MonoBlock is all spaces, False otherwise."""
 
-        # Concatenate lines, strip spaces, test for not empty string.
-        return not ''.join(self.lines).strip()
+        # Most headings have text on the first line so check it before
+        # scanning.  Stop at the first line that has something besides
+        # whitespace.
+        lines = self.lines
+        if lines[0].strip():
+            return False
+        return not any(map(str.strip, lines))
 
     def chop_to_fieldsize(self, fieldsize: int, more_marker: str = '') -> None:
         """
@@ -142,29 +182,29 @@ class MonoBlock:
             Ignores width if width is less than the instance width.
         """
 
-        justified_lines = []
         if width is None:
             width = self.width
         else:
             width = max(width, self.width)  # ignore width if smaller
-        for line in self.lines:
-            if self._halign == LEFT:
-                text = line.ljust(width)
-            elif self._halign == CENTER:
-                text = line.center(width)
-            elif self._halign == RIGHT:
-                text = line.rjust(width)
-            elif self._halign == NOT_SPECIFIED:
-                text = line.center(width)
-            else:    # pragma: no cover
-                # It should be an error to get to the assert statement
-                # if all the possible values of _halign have been handled.
-                monotable.alignment.validate_horizontal_align(self._halign)
-                assert False, 'missing branch for valid enumeration value.'
 
-            justified_lines.append(text)
-        self.lines = justified_lines
-        self._update_height_and_width()
+        # Select the str method once, then apply it to every line.
+        if self._halign == LEFT:
+            justify = str.ljust
+        elif self._halign == CENTER:
+            justify = str.center
+        elif self._halign == RIGHT:
+            justify = str.rjust
+        elif self._halign == NOT_SPECIFIED:
+            justify = str.center
+        else:    # pragma: no cover
+            # It should be an error to get to the assert statement
+            # if all the possible values of _halign have been handled.
+            monotable.alignment.validate_horizontal_align(self._halign)
+            assert False, 'missing branch for valid enumeration value.'
+
+        self.lines = [justify(line, width) for line in self.lines]
+        # Every line is now exactly width long and height is unchanged.
+        self.width = width
         self._is_hjustified = True        # keep track for add_border()
 
     def vjustify(
@@ -328,10 +368,7 @@ class MonoBlock:
 
     def _update_height_and_width(self) -> None:
         self.height = len(self.lines)
-        line_widths = [len(line) for line in self.lines]
-        for width in line_widths:
-            assert width >= 0, 'len_func must return value >= 0.'
-        self.width = max(line_widths)
+        self.width = max(map(len, self.lines))
 
     def __str__(self) -> str:
         return '\n'.join(self.lines)
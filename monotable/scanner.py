@@ -22,7 +22,6 @@
 """
 
 import collections
-import fnmatch
 from typing import List, Tuple, Optional
 
 import monotable.plugin
@@ -230,13 +229,13 @@ class FormatScanner:
             Since v2.1.0 option_spec refers to format directives.
         """
 
-        startswith_match = self._start + '*' + self._end + '*'
-        if fnmatch.fnmatchcase(option_format_spec, startswith_match):
+        if option_format_spec.startswith(self._start):
             # look for self._end starting char after self._start
             option_spec_end = option_format_spec.find(self._end, 1)
-            option_spec = option_format_spec[:option_spec_end + 1]
-            format_spec = option_format_spec[option_spec_end + 1:]
-            return option_spec, format_spec
+            if option_spec_end != -1:
+                option_spec = option_format_spec[:option_spec_end + 1]
+                format_spec = option_format_spec[option_spec_end + 1:]
+                return option_spec, format_spec
         return '', option_format_spec
 
     def _scan(self, option_spec: str) -> None:
@@ -37,15 +37,18 @@
 """
 
 
-import copy
+import functools
 import numbers
 import string
-import textwrap
-import traceback
+from itertools import islice
+from itertools import repeat
+from operator import attrgetter
+from operator import itemgetter
 from itertools import zip_longest
-from typing import List, Tuple, Optional, Callable, Mapping
+from typing import List, Tuple, Optional, Callable, Mapping, Dict
 from typing import Union, Any, Sequence, Iterable
 from typing import cast
+from typing import TYPE_CHECKING
 
 import monotable.plugin
 import monotable.scanner
@@ -57,6 +60,9 @@ from monotable.alignment import NOT_SPECIFIED
 from monotable.alignment import LEFT
 from monotable.alignment import RIGHT
 
+if TYPE_CHECKING:
+    import textwrap
+
 Cell = Any
 Row = Iterable[Cell]
 CellGrid = Iterable[Row]
@@ -73,6 +79,72 @@ def _transpose(grid: Iterable[Iterable[Any]]) -> List[Tuple[Any, ...]]:
     return list(zip(*grid))
 
 
+@functools.lru_cache(maxsize=128)
+def _cached_format_scanner(
+        format_str: str,
+        config: monotable.scanner.MonoTableConfig
+        ) -> FormatScanner:
+    """Scan format_str.  config.format_func_map is a frozenset of items."""
+    items = config.format_func_map
+    if items is not None:
+        config = config._replace(format_func_map=dict(items))
+    return FormatScanner(format_str, config)
+
+
+def _scan_format(
+        format_str: str,
+        config: monotable.scanner.MonoTableConfig
+        ) -> FormatScanner:
+    """Return FormatScanner for format_str, reusing an earlier scan.
+
+    The FormatScanner depends only on format_str and config, so
+    tables printed repeatedly with the same formats skip the scanning.
+    The returned instance may be shared and must not be modified.
+    """
+    try:
+        format_func_map = config.format_func_map
+        if format_func_map is not None:
+            # The items are unique by name so their order does not matter.
+            format_func_map = frozenset(format_func_map.items())
+        return _cached_format_scanner(
+            format_str, config._replace(format_func_map=format_func_map))
+    except TypeError:
+        # Something in config is not hashable.  Scan without the cache.
+        return FormatScanner(format_str, config)
+
+
+@functools.lru_cache(maxsize=128)
+def _text_wrapper(
+        width: int,
+        break_long_words: bool,
+        break_on_hyphens: bool
+        ) -> 'textwrap.TextWrapper':
+    """Return a TextWrapper.  TextWrapper.fill() does not modify it."""
+    # Imported here since only the wrap directive and title wrap need it.
+    import textwrap
+    return textwrap.TextWrapper(width=width,
+                                break_long_words=break_long_words,
+                                break_on_hyphens=break_on_hyphens)
+
+
+@functools.lru_cache(maxsize=32)
+def _separated_guideline(
+        guideline_char: str,
+        widths: Tuple[int, ...],
+        seps: Tuple[str, ...]
+        ) -> str:
+    """Return guideline with seps between the columns."""
+    return ''.join([(guideline_char * width) + sep
+                    for width, sep in zip(widths, seps)])
+
+
+# Fetch MonoBlock dimensions in C when reducing rows and columns.
+_get_width = attrgetter('width')
+_get_height = attrgetter('height')
+_get_lines = attrgetter('lines')
+_get_first = itemgetter(0)
+
+
 class _HR:
     """Type to distinguish a horizontal rule from other cell types."""
     pass
@@ -86,6 +158,25 @@ A row that starts with a HR is omitted from the
 table and a heading guideline is inserted in its place.
 """
 
+# Short cellgrid rows are extended with this single shared instance.
+# It is OK to share the instance because _special_cases() clones each
+# MonoBlock found in the cellgrid before it is justified.
+_BLANK_MONOBLOCK = MonoBlock()
+
+# Concrete types that auto-align right without the numbers.Number ABC check.
+_NUMERIC_TYPES = (int, float, complex)
+
+# Auto-alignment of the most common exact cell types.  Types missing here
+# are looked up by MonoTable._halign_suggestion().
+# Cells of these types are never formatting special cases.
+_HALIGN_BY_TYPE = {
+    str: LEFT,
+    int: RIGHT,
+    float: RIGHT,
+    bool: RIGHT,
+    complex: RIGHT,
+}
+
 
 class MonoTable:
     """Create an aligned and formatted text table from a grid of cells.
@@ -326,6 +417,14 @@ class MonoTable:
     Setting wrap_spec_char to "" disables title text wrap.
     """
 
+    wrap_break_on_hyphens = True
+    """Text wrap may break lines after hyphens in compound words.
+
+    Applies to the wrap format directive and to title text wrap.
+    Setting wrap_break_on_hyphens to False breaks lines only on
+    whitespace.
+    """
+
     option_spec_delimiters = '(;)'
     """Three characters to enclose and separate format directives.
 
@@ -383,7 +482,7 @@ class MonoTable:
     Applies to bordered tables.
     """
 
-    def __init__(self, indent=''):    # type: (str) -> None
+    def __init__(self, indent: str = '') -> None:
         """
         Args:
             indent (str):
@@ -618,15 +717,20 @@ class MonoTable:
         """
 
         # convert, format, and justify headings/cells into MonoBlock objects
-        justified_headings, justified_cells, widths, seps = (
-            self._format_and_justify(headings,
-                                     formats,
-                                     cellgrid))
+        justified_headings, justified_cell_columns, widths, seps = (
+            self._format_and_justify_columns(headings,
+                                             formats,
+                                             cellgrid))
 
-        table_width = sum(widths) + sum([len(s) for s in seps])
+        table_width = sum(widths) + sum(map(len, seps))
 
-        top_guideline, heading_guideline, bottom_guideline = (
-            self._make_guidelines(table_width, widths, seps))
+        # Only a space suppresses a guideline.  See _make_guidelines().
+        if self.guideline_chars[:3].strip(' '):
+            top_guideline, heading_guideline, bottom_guideline = (
+                self._make_guidelines(table_width, widths, seps))
+        else:
+            # All guidelines are suppressed.
+            top_guideline = heading_guideline = bottom_guideline = ''
 
         lines = []    # type: List[str]
 
@@ -645,24 +749,16 @@ class MonoTable:
 
         # Add list of printable lines obtained from each row of cell
         # MonoBlocks.
-        for row in justified_cells:
-            # If a row starts with a cell of type _InternalGuideline,
-            # replace the entire row with the single line heading guideline.
-            # It is possible heading_guideline will be the empty string
-            # if it has been disabled by self.guideline_chars.  In that
-            # case a blank line appears in the table.
-            if isinstance(row[0], _InternalGuideline):
-                lines.append(heading_guideline)
-            else:
-                lines.extend(self._monoblock_row_to_strings(row, seps))
+        lines.extend(self._cell_columns_to_strings(
+            justified_cell_columns, seps, heading_guideline))
 
         if bottom_guideline:
             lines.append(bottom_guideline)
 
-        # strip trailing spaces
-        lines = [line.rstrip() for line in lines]
-
-        return self.indent + ('\n' + self.indent).join(lines)
+        # Strip trailing spaces while joining.  The leading self.indent
+        # keeps the indent as the result when there are no lines.
+        return self.indent + ('\n' + self.indent).join(
+            [line.rstrip() for line in lines])
 
     def _format_and_justify(
             self,
@@ -699,6 +795,40 @@ class MonoTable:
 
         """
 
+        (processed_headings, justified_cell_columns,
+            widths, seps) = self._format_and_justify_columns(headings,
+                                                             formats,
+                                                             cellgrid)
+
+        # typing cast explained:
+        # 1. _transpose() returns type List[Tuple[Any, ...]]
+        # 2. justified_cell_columns is type List[List[MonoBlock]]
+        # 3. _format_and_justify returns a four item tuple. The second item
+        #    is type List[Tuple[MonoBlock]] which is the result of the cast.
+        # 4. _transpose() returns type List[Tuple[Any, ...]].
+        # Here _transpose() converts the inner most type from MonoBlock
+        # to the more general Any.
+        # The cast changes the inner most type back to MonoBlock.
+        return (
+            processed_headings,
+            cast(List[Tuple[MonoBlock]], _transpose(justified_cell_columns)),
+            widths,
+            seps
+            )
+
+    def _format_and_justify_columns(
+            self,
+            headings: Iterable[str] = (),
+            formats: Iterable[str] = (),
+            cellgrid: CellGrid = ((),),
+    ) -> Tuple[List[MonoBlock], List[List[MonoBlock]], List[int], List[str]]:
+        """Same as _format_and_justify() but cells are returned as columns.
+
+        The justified cells are left in the column order they are
+        formatted and justified in.  Callers that consume whole
+        columns skip transposing to rows and back.
+        """
+
         # Assure headings, formats, and each row in cellgrid are same length
         # by adding blank headings and cells and dropping extra formats.
         xheadings, xformats, xcellgrid = (
@@ -714,7 +844,7 @@ class MonoTable:
         # Determine alignment, convert to MonoBlock.
         processed_headings = self._process_headings(
             xheadings,
-            xformats,
+            processed_formats,
             xcellgrid[0])
 
         widths = self._calculate_column_widths(
@@ -725,18 +855,9 @@ class MonoTable:
         self._justify_headings(processed_headings, widths)
         self._justify_cell_columns(formatted_cell_columns, widths)
 
-        # typing cast explained:
-        # 1. _transpose() returns type List[Tuple[Any, ...]]
-        # 2. formatted_cell_columns is type List[List[MonoBlock]]
-        # 3. _format_and_justify returns a four item tuple. The second item
-        #    is type List[Tuple[MonoBlock]] which is the result of the cast.
-        # 4. _transpose() returns type List[Tuple[Any, ...]].
-        # Here _transpose() converts the inner most type from MonoBlock
-        # to the more general Any.
-        # The cast changes the inner most type back to MonoBlock.
         return (
             processed_headings,
-            cast(List[Tuple[MonoBlock]], _transpose(formatted_cell_columns)),
+            formatted_cell_columns,
             widths,
             self._make_list_of_seps(processed_formats)
             )
@@ -746,7 +867,7 @@ class MonoTable:
             headings: Iterable[str] = (),
             formats: Iterable[str] = (),
             cellgrid: CellGrid = ((),),
-            ) -> Tuple[List[str], List[str], List[List[Cell]]]:
+            ) -> Tuple[List[str], List[str], List[Sequence[Cell]]]:
         """Create new headings, formats, and cellgrid so rows are equal length.
 
         Returns new lists of headings, formats, and a new cellgrid.
@@ -759,61 +880,121 @@ class MonoTable:
         headings and formats are extended with the empty string.
         cellgrid rows are extended with a single instance of MonoBlock.
         MonoBlock instances receive special handling during formatting.
+
+        Tuple rows, and list rows when cellgrid is a list or tuple, that
+        are not extended are placed in the new cellgrid without a copy.
+        Rows provided by the caller are never modified.
         """
 
-        # Convert cellgrid to list of lists in order to determine the length
-        # of each row.  Also test that each row is iterable.
-        xcellgrid = []    # type: List[List[Cell]]
-        for row in cellgrid:
-            try:
-                xcellgrid.append(list(row))  # copy and convert row to list
-            except TypeError as exc:
-                msg = 'If one row cellgrid, likely missing outer list.'
-                assert False, 'Exception "{}". {}'.format(str(exc), msg)
+        xcellgrid, longest, shortest = MonoTable._collect_rows(cellgrid)
 
         # Convert from Iterable to List.
         xheadings = list(headings)
-        num_columns = max([len(xheadings)] + [len(row) for row in xcellgrid])
+        num_columns = max(len(xheadings), longest)
 
         # extend any short rows in xcellgrid
-        for row in xcellgrid:
-            row.extend([MonoBlock()] * (num_columns - len(row)))
-            # It is OK to extend with same instance of MonoBlock because
-            # of special handling later by _format_cells_as_columns().
+        if shortest is not None and shortest < num_columns:
+            MonoTable._pad_short_rows(xcellgrid, num_columns)
 
-        # Extend by more than needed, truncate to len() = num_columns.
-        xheadings.extend([''] * num_columns)
-        xheadings = xheadings[:num_columns]
+        # num_columns is at least len(xheadings) so headings never truncate.
+        xheadings += [''] * (num_columns - len(xheadings))
 
         # Make copy and convert to list.
-        # Extend by more than needed, truncate to len() = num_columns.
+        # Extend too short formats, truncate too long formats.
         xformats = list(formats)
-        xformats.extend([''] * num_columns)
-        xformats = xformats[:num_columns]
+        if len(xformats) > num_columns:
+            del xformats[num_columns:]
+        else:
+            xformats += [''] * (num_columns - len(xformats))
 
         return xheadings, xformats, xcellgrid
 
+    @staticmethod
+    def _collect_rows(
+            cellgrid: CellGrid
+            ) -> Tuple[List[Sequence[Cell]], int, Optional[int]]:
+        """Return list of cellgrid rows and the longest and shortest length.
+
+        Convert cellgrid to list of sequences in order to determine the
+        length of each row.  Also test that each row is iterable.
+        Tuple rows cannot change so they are always kept as is.
+        shortest is None if there are no rows.
+        """
+
+        # A row list can be shared only if the caller holds on to it.
+        # An iterator might yield the same list object refilled per row.
+        share_lists = isinstance(cellgrid, (list, tuple))
+
+        xcellgrid = []    # type: List[Sequence[Cell]]
+        append = xcellgrid.append
+        longest = 0
+        shortest = None    # type: Optional[int]
+        for row in cellgrid:
+            if not (isinstance(row, tuple) or
+                    (share_lists and type(row) is list)):
+                try:
+                    row = list(row)  # copy and convert row to list
+                except TypeError as exc:
+                    msg = 'If one row cellgrid, likely missing outer list.'
+                    assert False, 'Exception "{}". {}'.format(str(exc), msg)
+            append(row)
+            length = len(row)
+            if length > longest:
+                longest = length
+            if shortest is None or length < shortest:
+                shortest = length
+        return xcellgrid, longest, shortest
+
+    @staticmethod
+    def _pad_short_rows(
+            xcellgrid: List[Sequence[Cell]],
+            num_columns: int
+            ) -> None:
+        """Replace rows shorter than num_columns with extended copies."""
+        for index, row in enumerate(xcellgrid):
+            num_short = num_columns - len(row)
+            if num_short > 0:
+                # Copy first in case row is the caller's list.
+                row = xcellgrid[index] = list(row)
+                row.extend(repeat(_BLANK_MONOBLOCK, num_short))
+                # It is OK to extend with same instance of MonoBlock
+                # because of special handling later by
+                # _format_cells_as_columns().
+
     def _process_headings(
             self,
             headings: Iterable[str],
-            formats: Iterable[str],
+            processed_formats: Iterable[FormatScanner],
             cellgrid_row: Row
             ) -> List[MonoBlock]:
-        """Determine align for each heading, convert to MonoBlocks."""
+        """Determine align for each heading, convert to MonoBlocks.
+
+        The format align_spec was already scanned by _process_formats()
+        so it is taken from the FormatScanner rather than scanned again.
+        """
 
         heading_monoblocks = []     # type: List[MonoBlock]
-        for heading, format_str, cell in zip(headings, formats, cellgrid_row):
-            align, text = monotable.alignment.split_up(
-                heading, self.align_spec_chars)
-            format_align, _ = monotable.alignment.split_up(
-                format_str, self.align_spec_chars)
+        # local names for lookups made once per column
+        split_up = monotable.alignment.split_up
+        align_spec_chars = self.align_spec_chars
+        halign_suggestion = self._halign_suggestion
+        append = heading_monoblocks.append
+        for heading, formatobj, cell in zip(
+                headings, processed_formats, cellgrid_row):
+            if not heading:
+                # Missing headings are padded with ''.  Any alignment
+                # justifies the empty heading to spaces.
+                append(MonoBlock())
+                continue
+            align, text = split_up(heading, align_spec_chars)
 
             # alignment for headings is determined by presence of
             # heading align_spec, format align_spec or by type (numeric or
             # all other) of the cell in the column.
-            default = self._halign_suggestion(cell)    # type: int
-            head_align = align or format_align or default    # type: int
-            heading_monoblocks.append(MonoBlock(text, head_align))
+            # The cell type is looked at only when neither is specified.
+            head_align = (align or formatobj.align
+                          or halign_suggestion(cell))    # type: int
+            append(MonoBlock(text, head_align))
         return heading_monoblocks
 
     @staticmethod
@@ -821,7 +1002,18 @@ class MonoTable:
         """
         Return horizontal alignment enum value determined from the item type.
         """
-        if isinstance(item, numbers.Number):
+        # Look up the common exact types, then test the concrete types
+        # before the slower numbers.Number ABC check.  The ABC check
+        # still catches Decimal, Fraction, and types registered with
+        # numbers.Number such as numpy scalars.
+        align = _HALIGN_BY_TYPE.get(type(item))
+        if align is not None:
+            return align
+        elif isinstance(item, _NUMERIC_TYPES):
+            return RIGHT
+        elif isinstance(item, str):
+            return LEFT
+        elif isinstance(item, numbers.Number):
             return RIGHT
         else:
             return LEFT
@@ -846,10 +1038,7 @@ class MonoTable:
             option_spec_delimiters=self.option_spec_delimiters)
 
         for column_index, format_str in enumerate(formats):
-            formatobj = monotable.scanner.FormatScanner(
-                format_str,
-                instance_config
-                )
+            formatobj = _scan_format(format_str, instance_config)
             if formatobj.error_text:
                 fmt = 'cell column {:d}, format= {}\n{}'
                 error_message = fmt.format(
@@ -928,43 +1117,108 @@ class MonoTable:
             ) -> List[Union[MonoBlock, str]]:
         """Format cells in the column and handle special case cells."""
         formatted_column = []    # type: List[Union[MonoBlock, str]]
+        format_spec = formatobj.format_spec
+        float_format_spec = self._float_format_spec(formatobj)
+        format_func = formatobj.format_func
+        parentheses = formatobj.parentheses
+        zero = formatobj.zero
+
+        fast_column = self._format_column_fast(
+            formatobj, float_format_spec, cell_column)
+        if fast_column is not None:
+            return fast_column
+
+        append = formatted_column.append
         for row_index, item in enumerate(cell_column):
 
             # for special cases a MonoBlock is created immediately.
-            block1 = self._special_cases(item, formatobj)
-            if block1 is not None:
-                formatted_column.append(block1)
-                continue
-
-            item_format_spec = self._make_format_spec(item, formatobj)
+            # Cells of the common exact types are never special cases.
+            if type(item) not in _HALIGN_BY_TYPE:
+                block1 = self._special_cases(item, formatobj)
+                if block1 is not None:
+                    append(block1)
+                    continue
+
+            if isinstance(item, float):
+                item_format_spec = float_format_spec
+            else:
+                item_format_spec = format_spec
 
             try:
-                text = formatobj.format_func(item, item_format_spec)
+                text = format_func(item, item_format_spec)
             except (AttributeError, LookupError, TypeError, ValueError,
-                    ArithmeticError, AssertionError):
-                msg = traceback.format_exc()
+                    ArithmeticError, AssertionError) as cause:
+                # The trace text is formatted only if the callback
+                # reads exc.trace_text.
                 exc = MonoTableCellError(
                     row_index,
                     column_index,
                     item_format_spec,
-                    msg)  # type: MonoTableCellError
+                    cause=cause)  # type: MonoTableCellError
                 text = self.format_exc_callback(exc)
 
-            # for parentheses directive enclose negative numbers with (, ).
-            if formatobj.parentheses and isinstance(item, numbers.Number):
-                if text.startswith('-'):
-                    text = text[1:].join('()')
+            if ((parentheses or zero is not None)
+                    and isinstance(item, numbers.Number)):
+                text = self._number_directives(text, parentheses, zero)
 
-            # for zero directive replace the formatted number if all zeros.
-            if formatobj.zero is not None and isinstance(item, numbers.Number):
-                is_digit = [c in string.digits for c in text]
-                is_zero = [c == string.digits[0] for c in text]
-                if is_digit == is_zero:  # are all digits present zero?
-                    text = formatobj.zero
-
-            formatted_column.append(text)
+            append(text)
         return formatted_column
 
+    @staticmethod
+    def _format_column_fast(
+            formatobj: FormatScanner,
+            float_format_spec: str,
+            cell_column: Iterable[Cell]
+            ) -> Optional[List[Union[MonoBlock, str]]]:
+        """Format the whole column with map() and the BIF format().
+
+        A column whose cells are all of the common exact types needs
+        none of the per-cell special case and directive handling
+        when formatting with the BIF format().
+        Return None if the column does not qualify or on a formatting
+        error so the per-cell loop can report the failing cell.
+        """
+        if (formatobj.format_func is not format
+                or formatobj.parentheses or formatobj.zero is not None):
+            return None
+        format_spec = formatobj.format_spec
+        column_types = set(map(type, cell_column))
+        if not column_types.issubset(_HALIGN_BY_TYPE):
+            return None
+        try:
+            if float not in column_types:
+                return list(map(format, cell_column, repeat(format_spec)))
+            elif len(column_types) == 1:
+                return list(map(
+                    format, cell_column, repeat(float_format_spec)))
+            else:
+                return [format(item, float_format_spec
+                               if type(item) is float
+                               else format_spec)
+                        for item in cell_column]
+        except (LookupError, TypeError, ValueError, ArithmeticError):
+            return None
+
+    @staticmethod
+    def _number_directives(
+            text: str,
+            parentheses: bool,
+            zero: Optional[str]
+            ) -> str:
+        """Apply the parentheses and zero directives to a formatted number."""
+
+        # for parentheses directive enclose negative numbers with (, ).
+        if parentheses and text.startswith('-'):
+            text = text[1:].join('()')
+
+        # for zero directive replace the formatted number if all zeros.
+        if zero is not None:
+            is_digit = [c in string.digits for c in text]
+            is_zero = [c == string.digits[0] for c in text]
+            if is_digit == is_zero:  # are all digits present zero?
+                text = zero
+        return text
+
     @staticmethod
     def _justify_parentheses(
             formatobj: FormatScanner,
@@ -1024,36 +1278,95 @@ class MonoTable:
             ) -> List[MonoBlock]:
         """Create MonoBlocks, determine alignment, implement width control."""
         if formatobj.width is not None and formatobj.wrap:
-            text_wrapper = textwrap.TextWrapper(
-                width=formatobj.width,
-                break_long_words=True)    # type: Optional[textwrap.TextWrapper]    # noqa : E501
+            text_wrapper = _text_wrapper(
+                formatobj.width, True,
+                self.wrap_break_on_hyphens)    # type: Optional[textwrap.TextWrapper]    # noqa : E501
 
         else:
             text_wrapper = None
 
-        monoblock_column = []
+        column_align = formatobj.align
+        monoblock_column = None    # type: Optional[List[MonoBlock]]
+        if text_wrapper is None:
+            monoblock_column = self._str_column_to_monoblocks(
+                column_align, cell_column, formatted_column)
+
+        if monoblock_column is None:
+            monoblock_column = self._cells_to_monoblocks(
+                column_align, text_wrapper, cell_column, formatted_column)
+
+        # All MonoBlocks are subject to column width control specified
+        # by the width= and fixed directives.
+        width = formatobj.width
+        if width is not None:
+            more_marker = self.more_marker
+            fixed = formatobj.fixed
+            for block in monoblock_column:
+                # truncate too long lines
+                block.chop_to_fieldsize(width, more_marker)
+                if fixed:
+                    # pad to width=N too short lines
+                    block.hjustify(width)
+        return monoblock_column
+
+    @staticmethod
+    def _str_column_to_monoblocks(
+            column_align: int,
+            cell_column: Iterable[Cell],
+            formatted_column: List[Union[MonoBlock, str]]
+            ) -> Optional[List[MonoBlock]]:
+        """Make the MonoBlocks with map() when no per-cell work is needed.
+
+        This applies when every cell formatted to a str and the
+        alignment is set by the format or by common exact cell types.
+        Return None otherwise.
+        """
+        if set(map(type, formatted_column)) != {str}:
+            return None
+        texts = cast(List[str], formatted_column)
+        if column_align != NOT_SPECIFIED:
+            return list(map(MonoBlock, texts, repeat(column_align)))
+        if set(map(type, cell_column)).issubset(_HALIGN_BY_TYPE):
+            aligns = map(_HALIGN_BY_TYPE.__getitem__, map(type, cell_column))
+            return list(map(MonoBlock, texts, aligns))
+        return None
+
+    def _cells_to_monoblocks(
+            self,
+            column_align: int,
+            text_wrapper: Optional['textwrap.TextWrapper'],
+            cell_column: Iterable[Cell],
+            formatted_column: List[Union[MonoBlock, str]]
+            ) -> List[MonoBlock]:
+        """Wrap and align each formatted cell and make its MonoBlock."""
+        monoblock_column = []    # type: List[MonoBlock]
+        append = monoblock_column.append
+        auto_align = column_align == NOT_SPECIFIED
+        halign_suggestion = self._halign_suggestion
+        # The suggestion depends only on the cell type so remember
+        # it for each type seen in the column.
+        align_by_type: Dict[type, int] = {}
         for item, text in zip(cell_column, formatted_column):
 
             # Special case MonoBlocks are not subject to the
-            # wrap format directive.
-            if isinstance(text, MonoBlock):
-                monoblock_column.append(text)
+            # wrap format directive.  Most text is an exact str so
+            # test for that before the isinstance() check.
+            if type(text) is not str and isinstance(text, MonoBlock):
+                append(text)
                 continue
 
             if text_wrapper is not None:
                 text = text_wrapper.fill(text)
 
-            if formatobj.align == NOT_SPECIFIED:
-                align = self._halign_suggestion(item)
+            if auto_align:
+                item_type = type(item)
+                align = align_by_type.get(item_type)
+                if align is None:
+                    align = halign_suggestion(item)
+                    align_by_type[item_type] = align
             else:
-                align = formatobj.align
-            block = MonoBlock(text, align)
-            monoblock_column.append(block)
-
-        # All MonoBlocks are subject to column width control specified
-        # by the width= and fixed directives.
-        for block in monoblock_column:
-            self._adjust_width(formatobj, block)
+                align = column_align
+            append(MonoBlock(text, align))
         return monoblock_column
 
     def _special_cases(
@@ -1063,7 +1376,7 @@ class MonoTable:
             ) -> Optional[MonoBlock]:
         """Handle special cases that make a MonoBlock without format_func."""
 
-        if isinstance(item, _HR):
+        if type(item) is _HR:
             # The _HR instance is replaced with an _InternalGuideline.
             # The formatting steps are skipped.
             # _InternalGuideline is a subclass of MonoBlock so that
@@ -1104,12 +1417,12 @@ class MonoTable:
             #
             # The copy is made because MonoBlocks are modified
             # individually by the justification steps.
-            return copy.copy(item)
+            return item.clone()
         else:
             return None
 
-    def _make_format_spec(self, item: Cell, formatobj: FormatScanner) -> str:
-        """Return a custom format_spec if special cases."""
+    def _float_format_spec(self, formatobj: FormatScanner) -> str:
+        """Return the format_spec for float cells in the column."""
 
         format_spec = formatobj.format_spec
 
@@ -1118,28 +1431,14 @@ class MonoTable:
         #    - using BIF format()
         #    - empty format_spec string
         #    - non-empty class var default_float_format_spec
-        if (isinstance(item, float) and
-                format_spec == '' and
+        # The test is made once per column rather than once per cell.
+        if (format_spec == '' and
                 formatobj.format_func == format and  # BIF format()
                 self.default_float_format_spec):
             format_spec = self.default_float_format_spec
 
         return format_spec
 
-    def _adjust_width(
-            self,
-            formatobj: FormatScanner,
-            block: MonoBlock
-            ) -> None:
-        """Control width of block.  Modifies callers block."""
-
-        if formatobj.width is not None:
-            # truncate too long lines
-            block.chop_to_fieldsize(formatobj.width, self.more_marker)
-            if formatobj.fixed:
-                # pad to width=N too short lines
-                block.hjustify(formatobj.width)
-
     @staticmethod
     def _make_list_of_seps(
             processed_formats: List[FormatScanner]) -> List[str]:
@@ -1171,14 +1470,9 @@ class MonoTable:
         """Determine width of each column in the table."""
 
         # width is length of widest heading or formatted cell
-        heading_column_widths = [t.width for t in heading_monoblocks]
-        cellgrid_column_widths = []
-        for col in cell_monoblock_columns:
-            cellgrid_column_widths.append(max([t.width for t in col]))
-
-        table_widths = [max(hwidth, cwidth) for hwidth, cwidth in
-                        zip(heading_column_widths, cellgrid_column_widths)]
-        return table_widths
+        return [max(heading.width, max(map(_get_width, col), default=0))
+                for heading, col in zip(heading_monoblocks,
+                                        cell_monoblock_columns)]
 
     def _justify_headings(
             self,
@@ -1194,7 +1488,7 @@ class MonoTable:
 
         # vertically justify headings
         if processed_headings:
-            max_heading_height = max([t.height for t in processed_headings])
+            max_heading_height = max(map(_get_height, processed_headings))
             for tb in processed_headings:
                 tb.vjustify(self.heading_valign,
                             max_heading_height, more_marker='n/a')
@@ -1206,25 +1500,37 @@ class MonoTable:
             ) -> None:
         """Justify cell columns horizontally and vertically."""
 
+        monotable.alignment.validate_vertical_align(self.cell_valign)
+        if not cell_monoblock_columns:
+            return
+
+        # Find the height of each row one column at a time rather than
+        # transposing the cell MonoBlocks into rows.
+        # Horizontal justification does not change the height.
+        # Every MonoBlock is at least one line high.  A column of
+        # single line cells cannot raise any row height, and the
+        # column's max height is found in C, so skip those columns.
+        row_heights = [1] * len(cell_monoblock_columns[0])
+        for column in cell_monoblock_columns:
+            if max(map(_get_height, column)) > 1:
+                row_heights = list(
+                    map(max, row_heights, map(_get_height, column)))
+        if self.max_cell_height:  # configured height limit?
+            # yes- don't exceed the height limit
+            row_heights = [min(self.max_cell_height, row_height)
+                           for row_height in row_heights]
+
+        # Justify each cell horizontally and then vertically in one pass.
         # The caller typically sets the halign attribute at MonoBlock
-        # creation time.
+        # creation time.  Cells already at the row height are skipped
+        # by vjustify() so the call is avoided here.
+        cell_valign = self.cell_valign
+        more_marker = self.more_marker
         for column, width in zip(cell_monoblock_columns, widths):
-            for tb in column:
+            for tb, height in zip(column, row_heights):
                 tb.hjustify(width)
-
-        # vertically justify cells
-        monotable.alignment.validate_vertical_align(self.cell_valign)
-        cell_rows = _transpose(cell_monoblock_columns)
-        for row in cell_rows:
-            row_height = max([t.height for t in row])
-            if not self.max_cell_height:  # configured height limit?
-                height = row_height       # no-
-            else:
-                # yes- don't exceed the height limit
-                height = min(self.max_cell_height, row_height)
-
-            for tb in row:
-                tb.vjustify(self.cell_valign, height, self.more_marker)
+                if tb.height != height:
+                    tb.vjustify(cell_valign, height, more_marker)
 
     def _make_guidelines(
             self,
@@ -1241,24 +1547,23 @@ class MonoTable:
         # columns.  This looks good when the seps are all spaces.
 
         # Assure len()==3.
-        three_chars = (self.guideline_chars + '   ')[:3]
+        three_chars = self.guideline_chars[:3].ljust(3)
 
         if self.separated_guidelines:
             # Create guidelines with seps between columns.
             guidelines = []    # type: List[str]
+            widths_tuple = tuple(widths)
+            seps_tuple = tuple(seps)
             for guideline_char in three_chars:
                 if guideline_char == ' ':
                     guidelines.append('')
                 else:
-                    guideline_parts = [(guideline_char * width) + sep
-                                       for width, sep in zip(widths, seps)]
-                    guidelines.append(''.join(guideline_parts))
+                    guidelines.append(_separated_guideline(
+                        guideline_char, widths_tuple, seps_tuple))
             return guidelines
         else:
             # Create guidelines with no spaces.
-            guidelines = [c * table_width for c in three_chars]
-            stripped = [guideline.strip() for guideline in guidelines]
-            return stripped
+            return [(c * table_width).strip() for c in three_chars]
 
     def _make_title_lines(self, title: str, width: int) -> List[str]:
         """Convert title to text lines and justify if narrower than table."""
@@ -1267,11 +1572,12 @@ class MonoTable:
                                                    self.align_spec_chars)
         if self.wrap_spec_char and text.startswith(self.wrap_spec_char):
             text = text[1:]
-            if width:
-                wrapper = textwrap.TextWrapper(
-                    width=width,
-                    break_long_words=False)
-                text = wrapper.fill(text)
+            # TextWrapper.fill() returns a short title that is already
+            # single spaced between words unchanged, so skip it.
+            fits = len(text) <= width and text == ' '.join(text.split())
+            if width and not fits:
+                text = _text_wrapper(
+                    width, False, self.wrap_break_on_hyphens).fill(text)
         mb = MonoBlock(text, align)
         if mb.width <= width:
             mb.hjustify(width)
@@ -1283,6 +1589,51 @@ class MonoTable:
 
         return any((not t.is_all_spaces() for t in justified_headings))
 
+    @classmethod
+    def _cell_columns_to_strings(
+            cls,
+            columns: List[List[MonoBlock]],
+            seps: List[str],
+            guideline: str
+            ) -> List[str]:
+        """Convert columns of cell MonoBlocks to a list of lines.
+
+        A row that starts with an _InternalGuideline is replaced by
+        the single line guideline.
+        """
+        if columns and all(max(map(_get_height, column)) == 1
+                           for column in columns):
+            # Every cell is a single line.  Join whole columns of
+            # first lines with the seps in C rather than row by row.
+            parts = []    # type: List[Iterable[str]]
+            for column, sep in zip(columns, seps):
+                parts.append(map(_get_first, map(_get_lines, column)))
+                parts.append(repeat(sep))
+            single_lines = list(map(''.join, zip(*parts)))
+
+            # _InternalGuideline has no subclasses so compare the type.
+            if _InternalGuideline in set(map(type, columns[0])):
+                for index, block in enumerate(columns[0]):
+                    if type(block) is _InternalGuideline:
+                        single_lines[index] = guideline
+            return single_lines
+
+        lines = []    # type: List[str]
+        append = lines.append
+        extend = lines.extend
+        row_to_strings = cls._monoblock_row_to_strings
+        for row in zip(*columns):
+            # If a row starts with a cell of type _InternalGuideline,
+            # replace the entire row with the single line heading guideline.
+            # It is possible heading_guideline will be the empty string
+            # if it has been disabled by self.guideline_chars.  In that
+            # case a blank line appears in the table.
+            if type(row[0]) is _InternalGuideline:
+                append(guideline)
+            else:
+                extend(row_to_strings(row, seps))
+        return lines
+
     @staticmethod
     def _monoblock_row_to_strings(
             row_of_monoblocks: Sequence[MonoBlock],
@@ -1294,14 +1645,31 @@ class MonoTable:
         If seps is None no text is inserted between columns.
         If seps is a list, insert from list after each column.
         """
-        lines = []
-        text_columns = [t.lines for t in row_of_monoblocks]
-        text_rows = _transpose(text_columns)
         if seps is None:
-            seps = [''] * len(row_of_monoblocks)  # 1 sep per column
-        for textrow in text_rows:
-            line = ''.join(''.join(pair) for pair in zip(textrow, seps))
-            lines.append(line)
+            # Nothing goes between the columns so join the text directly.
+            if row_of_monoblocks and row_of_monoblocks[0].height == 1:
+                return [''.join([t.lines[0] for t in row_of_monoblocks])]
+            return [''.join(textrow) for textrow in
+                    zip(*[t.lines for t in row_of_monoblocks])]
+
+        # Interleave text and seps in a reused list so each line is
+        # a single join.  The seps stay in the odd numbered slots.
+        num_columns = len(row_of_monoblocks)
+        parts = [''] * (2 * num_columns)
+        parts[1::2] = seps[:num_columns]
+
+        # Single line rows are the common case.  The transpose below
+        # stops at the shortest block so a row whose first block is one
+        # line high produces exactly one line.
+        if num_columns and row_of_monoblocks[0].height == 1:
+            parts[0::2] = [t.lines[0] for t in row_of_monoblocks]
+            return [''.join(parts)]
+
+        text_columns = [t.lines for t in row_of_monoblocks]
+        lines = []
+        for textrow in zip(*text_columns):
+            parts[0::2] = textrow
+            lines.append(''.join(parts))
         return lines
 
     def bordered_table(
@@ -1378,22 +1746,23 @@ class MonoTable:
             # in the last line of the headings
             # example: +--------+-----+ -> +========+=====+ when
             # self.border_chars='_-|+='
-            lines[-1] = lines[-1].replace(bottom_border_char,
-                                          bordered_heading_guideline_char)
-
-        for row in justified_cells:
-            self._add_borders_to_monoblock_row(row, border_chars)
+            heading_guideline_table = str.maketrans(
+                bottom_border_char, bordered_heading_guideline_char)
+            lines[-1] = lines[-1].translate(heading_guideline_table)
 
         # if headings remove top border line of all cells
         # if no headings remove top border line from all but first row of cells
         start = 0 if table_has_headings else 1
-        for row in justified_cells[start:]:
-            for monoblock in row:
-                monoblock.remove_top_line()
+        for row_index, row in enumerate(justified_cells):
+            self._add_borders_to_monoblock_row(
+                row, border_chars, remove_top=row_index >= start)
 
         # convert cell rows to printable lines
+        # No text is inserted between bordered columns so no seps are
+        # passed.  The rows are joined without a list of empty seps.
+        row_to_strings = self._monoblock_row_to_strings
         for row in justified_cells:
-            lines.extend(self._monoblock_row_to_strings(row))
+            lines.extend(row_to_strings(row))
 
         # prepend the title lines above the table
         if title:
@@ -1401,25 +1770,31 @@ class MonoTable:
             title_lines = self._make_title_lines(title, table_width)
             lines = title_lines + lines
 
-        # strip trailing spaces
-        lines = [line.rstrip() for line in lines]
-
-        return self.indent + ('\n' + self.indent).join(lines)
+        # Strip trailing spaces while joining.
+        return self.indent + ('\n' + self.indent).join(
+            [line.rstrip() for line in lines])
 
     def _add_borders_to_monoblock_row(
             self,
             row_of_monoblocks: Sequence[MonoBlock],
-            border_chars: str
+            border_chars: str,
+            remove_top: bool = False
             ) -> None:
-        """Add borders to row of monoblocks.  Modifies in-place."""
+        """Add borders to row of monoblocks.  Modifies in-place.
 
+        If remove_top is True also remove the top border line so the
+        row stacks under the row above it.
+        """
+
+        hmargin = self.hmargin
+        vmargin = self.vmargin
+        border_chars = border_chars[:-1]  # w/o guideline
         for monoblock in row_of_monoblocks:
-            monoblock.add_border(
-                self.hmargin,
-                self.vmargin,
-                border_chars[:-1])  # w/o guideline
+            monoblock.add_border(hmargin, vmargin, border_chars)
+            if remove_top:
+                monoblock.remove_top_line()
         # only need one side border between adjacent columns
-        for monoblock in row_of_monoblocks[1:]:
+        for monoblock in islice(row_of_monoblocks, 1, None):
             monoblock.remove_left_column()
 
     def _calculate_bordered_table_width(
@@ -1494,14 +1869,12 @@ class MonoTable:
         combined = [tupled_justified_headings]
         combined.extend(justified_cells)
 
-        # Convert to strings/strip.
-        rows = []    # type: List[List[str]]
-        for monoblock_row in combined:
-            row = [str(block) for block in monoblock_row]
-            if strip:
-                row = [item.strip() for item in row]
-            rows.append(row)
-        return rows
+        # Convert to strings/strip.  Strip as each string is made.
+        if strip:
+            return [[str(block).strip() for block in monoblock_row]
+                    for monoblock_row in combined]
+        else:
+            return [list(map(str, monoblock_row)) for monoblock_row in combined]
 
     def cotable(
             self,
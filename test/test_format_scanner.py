@@ -253,6 +253,16 @@ def test_parse_nested_start_end_char_pairs(format_scanner):
     assert option_spec == '(()'
     assert format_spec == ')f'
 
+
+def test_parse_glob_special_delimiters():
+    """Delimiters that are fnmatch wildcard characters are taken literally."""
+    config = MONOTABLE_CONFIG._replace(option_spec_delimiters='[;]')
+    fs = monotable.scanner.FormatScanner('[width=3;fixed]d', config)
+    assert fs.error_text == ''
+    assert fs.width == 3
+    assert fs.fixed is True
+    assert fs.format_spec == 'd'
+
 #
 # Tests for FormatScanner.__init__().
 #
@@ -1,4 +1,7 @@
 """Assertion based test cases for monotable.table.MonoBlock."""
+import copy
+import weakref
+
 import pytest
 
 import monotable.table
@@ -160,6 +163,57 @@ def test_trailing_whitespace():
     assert str(mb) == 'abc  \n  \t'
 
 
+#
+# Tests for MonoBlock.clone().
+#
+
+def test_clone():
+    mb = monotable.table.MonoBlock('ab\ncdef', RIGHT)
+    mb.hjustify(6)
+    clone = mb.clone()
+    assert clone is not mb
+    assert clone.lines == ['    ab', '  cdef']
+    assert clone.lines is not mb.lines
+    assert clone.height == 2
+    assert clone.width == 6
+    assert clone._halign == RIGHT
+    assert clone._is_hjustified is True
+
+
+def test_clone_is_independent():
+    mb = monotable.table.MonoBlock('ab')
+    clone = mb.clone()
+    clone.vjustify(TOP, 3)
+    assert clone.lines == ['ab', '  ', '  ']
+    assert mb.lines == ['ab']
+    assert mb.height == 1
+
+
+def test_copy_copy_clones():
+    mb = monotable.table.MonoBlock('ab\ncdef', RIGHT)
+    mb_copy = copy.copy(mb)
+    assert mb_copy is not mb
+    assert mb_copy.lines == mb.lines
+    assert mb_copy.lines is not mb.lines
+    assert mb_copy._halign == RIGHT
+
+
+def test_copy_copy_uses_subclass_clone():
+    class MyMonoBlock(monotable.table.MonoBlock):
+        def clone(self):
+            block = super().clone()
+            block.cloned_by_subclass = True
+            return block
+
+    mb_copy = copy.copy(MyMonoBlock('ab'))
+    assert mb_copy.cloned_by_subclass
+
+
+def test_weakref():
+    mb = monotable.table.MonoBlock('ab')
+    assert weakref.ref(mb)() is mb
+
+
 #
 # Tests for MonoBlock.is_all_spaces().
 #
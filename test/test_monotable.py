@@ -378,6 +378,21 @@ def test_headings_formats_cells_are_tuples_and_missing_items():
     assert text == expected
 
 
+def test_short_list_rows_are_not_modified():
+    cells = [[1, 2, 3], [4, 5]]    # second row is short
+    text = monotable.table.table(['a', 'b', 'c', 'd'], [], cells)
+    expected = '\n'.join([
+        "----------",
+        "a  b  c  d",
+        "----------",
+        "1  2  3",
+        "4  5",
+        "----------",
+    ])
+    assert text == expected
+    assert cells == [[1, 2, 3], [4, 5]]
+
+
 def test_cell_rows_are_named_tuples():
     row = namedtuple('Row', ['column0', 'column1', 'column2'])
     cells = (row(column0=1, column1=2, column2=3),
@@ -574,6 +589,27 @@ def test_mixed_float_and_string_columns():
     assert text == expected
 
 
+def test_wrap_break_on_hyphens():
+    cells = [['the quick-brown-fox']]
+    tbl = monotable.table.MonoTable()
+    tbl.guideline_chars = ''
+    text = tbl.table([], ['(width=14;wrap)'], cells)
+    assert text == 'the quick-\nbrown-fox'
+
+    tbl.wrap_break_on_hyphens = False
+    text = tbl.table([], ['(width=14;wrap)'], cells)
+    assert text == 'the quick-brow\nn-fox'
+
+
+def test_whitespace_guideline_chars_not_suppressed():
+    """Only a space suppresses a guideline, a tab makes a blank line."""
+    tbl = monotable.table.MonoTable()
+    tbl.guideline_chars = '\t'
+    tbl.separated_guidelines = True
+    text = tbl.table(['a', 'b'], [], [[1, 2]])
+    assert text == '\na  b\n1  2'
+
+
 def test_bordered_column_oriented_left_column_shorter():
     column0 = ('', '', (1, 4))
     column1 = ('', '', (2, 5, 8))
@@ -702,6 +738,29 @@ class TestMonoTableExceptionCallback:
         assert text == expected
 
 
+def test_format_error_in_column_of_one_type():
+    """The failing cell is found when all cells are the same type."""
+    cells = [[1.0, 5], [2.0, 6], [3.0, 10 ** 400]]
+    with pytest.raises(monotable.table.MonoTableCellError) as exc_info:
+        _ = monotable.table.table((), ['', '.2f'], cells)
+    exc = exc_info.value
+    assert exc.row == 2
+    assert exc.column == 1
+    assert exc.format_spec == '.2f'
+
+
+def test_cell_error_trace_text_from_cause():
+    try:
+        format('abc', 'd')
+    except ValueError as cause:
+        exc = monotable.table.MonoTableCellError(1, 2, 'd', cause=cause)
+    assert exc.trace_text.startswith('Traceback (most recent call last):')
+    assert exc.trace_text.endswith(
+        "ValueError: Unknown format code 'd' for object of type 'str'\n")
+    exc.trace_text = 'replaced'
+    assert exc.trace_text == 'replaced'
+
+
 def test_print_it(capsys):
     exc = monotable.table.MonoTableCellError(777, 999, 'spec',
                                              'this is the trace text')
@@ -798,6 +857,44 @@ def test_user_defined_format_function_raises_assertion_error():
     assert exc.name == 'MonoTableCellError'
 
 
+def test_changed_format_func_map_is_rescanned():
+    """A format string scanned earlier sees a changed format_func_map."""
+    class MyMonoTable(monotable.table.MonoTable):
+        format_func_map = {'my_format': lambda value, spec: 'first'}
+    tbl = MyMonoTable()
+    assert tbl.table([], ['(my_format)'], [[1]]).splitlines()[1] == 'first'
+    assert tbl.table([], ['(my_format)'], [[1]]).splitlines()[1] == 'first'
+    tbl.format_func_map = {'my_format': lambda value, spec: 'second'}
+    assert tbl.table([], ['(my_format)'], [[1]]).splitlines()[1] == 'second'
+
+
+def test_unhashable_format_func():
+    """A format_func that is not hashable is scanned without caching."""
+    class UnhashableFormat:
+        __hash__ = None
+
+        def __call__(self, value, format_spec):
+            return 'unhashable'
+
+    tbl = monotable.table.MonoTable()
+    tbl.format_func = UnhashableFormat()
+    assert tbl.table([], [''], [[1]]).splitlines()[1] == 'unhashable'
+
+
+def test_unhashable_format_func_map_value():
+    """A format_func_map value that is not hashable is not cached."""
+    class UnhashableFormat:
+        __hash__ = None
+
+        def __call__(self, value, format_spec):
+            return 'U'
+
+    class MyMonoTable(monotable.table.MonoTable):
+        format_func_map = {'my_format': UnhashableFormat()}
+    tbl = MyMonoTable()
+    assert tbl.table([], ['(my_format)'], [[1]]) == '-\nU\n-'
+
+
 def test_init_illegal_vertical_align():
     # Note- Does not test entire exception message.
     msg = 'Expected a vertical align value, got:'